@@ -0,0 +1,151 @@
+"""
+Real Estate Price Prediction - Shared Data Loading Helpers
+
+Parsing data/data.csv is the slowest step of most scripts in this folder.
+load_data() parses the CSV once, stores a Parquet copy next to it
+(data/data.v2.parquet) and reads that copy on every later run.
+read_csv() parses a CSV with PyArrow's multi-threaded reader using the
+fixed column schema below, so no per-column type inference is needed.
+build_preprocessor() and build_model() return the ColumnTransformer and the
+Gradient Boosting model shared by training, cross-validation and
+encode_features.py. PREPROCESSOR_VERSION is stored with the cached encoded
+matrix so a changed preprocessor invalidates it.
+read_csv_chunks() streams a CSV with the same schema and null handling,
+one record batch (about block_size bytes of CSV) at a time, for files that
+should not be held in memory at once.
+
+Usage:
+    from data_utils import build_model, build_preprocessor, load_data, read_csv, read_csv_chunks
+    df = load_data("data/data.csv")
+    test_df = read_csv("data/test.csv")
+    for chunk in read_csv_chunks("data/test.csv"): ...
+
+Notes:
+    - The Parquet cache is rebuilt automatically when the CSV is newer
+    - The cache is written atomically and skipped if data/ is read-only
+    - Categorical columns are loaded with pandas "category" dtype
+    - Empty and "NA" cells load as missing (NaN) in every column
+    - Columns missing from a file (e.g. price in test.csv) are ignored
+"""
+
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OrdinalEncoder
+
+# Text columns of the dataset, stored as pandas categoricals
+CATEGORICAL_COLS = ["gas", "hot_water", "central_heating", "extra_area_type_name", "district_name"]
+
+# Numerical features (float64 so missing values stay NaN)
+NUMERIC_COLS = [
+    "kitchen_area", "bath_area", "other_area", "extra_area", "extra_area_count", "year",
+    "ceil_height", "floor_max", "floor", "total_area", "bath_count", "rooms_count",
+]
+
+# Explicit schema: ID + target + 17 features
+COLUMN_TYPES = {
+    "index": pa.int64(),
+    "price": pa.float64(),
+    **{c: pa.float64() for c in NUMERIC_COLS},
+    **{c: pa.dictionary(pa.int32(), pa.string()) for c in CATEGORICAL_COLS},
+}
+
+# Same null policy as pandas: empty text cells are missing, not a "" category
+CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types=COLUMN_TYPES,
+    null_values=["", "NA"],
+    strings_can_be_null=True,
+)
+
+# Bumped whenever parsing changes, so caches written by older code are ignored
+CACHE_VERSION = 2
+
+# Bumped whenever build_preprocessor() changes, so encode_features.py output
+# written by older code is ignored
+PREPROCESSOR_VERSION = 2
+
+
+def read_csv(path):
+    """Parse a dataset CSV with PyArrow using the fixed column schema."""
+    table = pacsv.read_csv(path, convert_options=CONVERT_OPTIONS)
+    # Dictionary columns become pandas categoricals
+    return table.to_pandas()
+
+
+def read_csv_chunks(path, block_size=1 << 20):
+    """Iterate over a dataset CSV in DataFrames of about block_size bytes of CSV."""
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=CONVERT_OPTIONS,
+    )
+    for batch in reader:
+        yield batch.to_pandas()
+
+
+def load_data(path):
+    """Load a dataset CSV, using a Parquet cache to skip re-parsing the CSV."""
+    cache_path = f"{os.path.splitext(path)[0]}.v{CACHE_VERSION}.parquet"
+
+    # Reuse the cache unless the CSV was modified after it was written
+    if os.path.exists(cache_path) and (
+        not os.path.exists(path) or os.path.getmtime(cache_path) >= os.path.getmtime(path)
+    ):
+        return pd.read_parquet(cache_path, engine="pyarrow")
+
+    df = read_csv(path)
+    # Write then rename, so an interrupted run never leaves a truncated cache;
+    # if data/ is not writable the data is simply returned uncached
+    tmp_path = cache_path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return df
+
+
+def build_preprocessor(num_cols, cat_cols):
+    """Imputation + ordinal encoding; outputs num_cols first, then cat_cols codes."""
+    # Numerical: median imputation (tree models need no scaling). The matrix
+    # stays float64: HistGradientBoostingRegressor converts its input to
+    # float64 anyway, so a float32 cast would only add two conversions
+    numeric_transformer = Pipeline([
+        ("imputer", SimpleImputer(strategy="median"))
+    ])
+
+    # Categorical: mode imputation, then integer codes for native categorical splits
+    categorical_transformer = Pipeline([
+        ("imputer", SimpleImputer(strategy="most_frequent")),
+        ("ordinal", OrdinalEncoder(
+            handle_unknown="use_encoded_value",
+            unknown_value=-1,      # Unseen categories are treated as missing by the model
+            max_categories=255     # Native categorical support allows at most max_bins codes
+        ))
+    ])
+
+    return ColumnTransformer([
+        ("num", numeric_transformer, num_cols),
+        ("cat", categorical_transformer, cat_cols)
+    ])
+
+
+def build_model(n_num, n_cat):
+    """Gradient Boosting model for the build_preprocessor() output."""
+    # ColumnTransformer outputs numerical columns first, then categorical codes
+    cat_feature_idx = list(range(n_num, n_num + n_cat))
+    return HistGradientBoostingRegressor(
+        max_iter=500,           # Up to 500 boosting iterations
+        learning_rate=0.05,     # Shrinkage per iteration
+        max_bins=255,           # Features binned into uint8 histograms
+        max_leaf_nodes=31,      # Caps each tree's size (keeps the model file small)
+        min_samples_leaf=20,    # No leaf fits fewer than 20 properties
+        early_stopping=True,    # Stop when the internal validation score plateaus
+        categorical_features=cat_feature_idx,  # Native categorical splits
+        random_state=42         # Seed for reproducibility
+    )
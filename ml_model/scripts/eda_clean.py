@@ -1,6 +1,6 @@
-import pandas as pd
+from data_utils import load_data
 
-df = pd.read_csv("data/data.csv")
+df = load_data("data/data.csv")
 
 print("First 5 rows:")
 print(df.head())
@@ -12,7 +12,7 @@ print("\nColumn names:")
 print(list(df.columns))
 
 print("\nMissing values:")
-print(df.isna().sum())
+print(len(df) - df.count())  # Non-null counts, no full boolean mask
 
 print("\nData types:")
 print(df.dtypes)
@@ -0,0 +1,46 @@
+import os
+import joblib
+import numpy as np
+
+from data_utils import PREPROCESSOR_VERSION, build_preprocessor, load_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "data", "data.csv")
+ENCODED_PATH = os.path.join(BASE_DIR, "data", "X_encoded.npy")
+TARGET_PATH = os.path.join(BASE_DIR, "data", "y.npy")
+PREPROCESS_PATH = os.path.join(BASE_DIR, "preprocess.pkl")
+
+print("=" * 70)
+print("✅ ENCODE FEATURES ONCE - REAL ESTATE PRICE PREDICTION")
+print("=" * 70)
+print("✅ Loading:", DATA_PATH)
+
+df = load_data(DATA_PATH)
+TARGET = "price"
+
+X = df.drop(columns=[TARGET, "index"])
+y = df[TARGET]
+
+# Detect column types (same preprocessing as train_model_clean.py, via data_utils)
+cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
+cat_set = set(cat_cols)
+num_cols = [c for c in X.columns if c not in cat_set]
+
+preprocess = build_preprocessor(num_cols, cat_cols)
+
+X_encoded = preprocess.fit_transform(X)
+
+np.save(ENCODED_PATH, X_encoded)
+np.save(TARGET_PATH, y.to_numpy(dtype=np.float64))
+# Version stamp lets validate_cv.py reject output of an older build_preprocessor()
+joblib.dump({"version": PREPROCESSOR_VERSION, "preprocess": preprocess}, PREPROCESS_PATH)
+
+print(f"✅ Encoded matrix: {X_encoded.shape} ({X_encoded.dtype})")
+print("✅ Saved:", ENCODED_PATH)
+print("✅ Saved:", TARGET_PATH)
+print("✅ Saved:", PREPROCESS_PATH)
+
+print("\n✅ Explanation for viva:")
+print("- Imputation + encoding is done once and reused by later experiments.")
+print("- validate_cv.py memory-maps the saved matrix instead of re-encoding the CSV.")
+print("=" * 70)
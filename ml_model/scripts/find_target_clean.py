@@ -1,9 +1,11 @@
 import pandas as pd
+from data_utils import load_data
 
-train_df = pd.read_csv("data/data.csv")
+train_df = load_data("data/data.csv")
 test_df = pd.read_csv("data/test.csv")
 
-target_cols = [c for c in train_df.columns if c not in test_df.columns]
+test_cols = set(test_df.columns)
+target_cols = [c for c in train_df.columns if c not in test_cols]
 print("Target column found:", target_cols)
 
 if target_cols:
@@ -1,8 +1,11 @@
 import os
 import numpy as np
-import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # File output only: no GUI backend probe
 import matplotlib.pyplot as plt
 
+from data_utils import load_data
+
 # -----------------------------
 # Paths (safe)
 # -----------------------------
@@ -14,7 +17,7 @@ os.makedirs(OUT_DIR, exist_ok=True)
 # -----------------------------
 # Load dataset
 # -----------------------------
-df = pd.read_csv(DATA_PATH)
+df = load_data(DATA_PATH)
 
 TARGET = "price"
 
@@ -22,7 +25,7 @@ TARGET = "price"
 if "index" in df.columns:
     df_no_id = df.drop(columns=["index"])
 else:
-    df_no_id = df.copy()
+    df_no_id = df
 
 # Separate features/target
 X = df_no_id.drop(columns=[TARGET])
@@ -30,79 +33,96 @@ y = df_no_id[TARGET]
 
 # Identify numeric columns only
 num_cols = X.select_dtypes(include=[np.number]).columns.tolist()
-cat_cols = X.select_dtypes(include=["object"]).columns.tolist()
+cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
+
+# One Figure is reused for every plot (cleared between plots)
+fig, ax = plt.subplots()
+DEFAULT_FIGSIZE = tuple(fig.get_size_inches())
+
+
+def save_plot(filename):
+    fig.tight_layout()
+    fig.savefig(os.path.join(OUT_DIR, filename), dpi=200)
+    ax.clear()
+
+
+def hist_bar(values, bins=50):
+    # Bin in NumPy's C loop, then draw the precomputed counts as bars
+    # (NaN would break the automatic bin range, so drop it first as plt.hist does)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    ax.bar((edges[:-1] + edges[1:]) / 2, counts, width=np.diff(edges))
+
 
 # -----------------------------
 # 1) Price distribution (Histogram)
 # -----------------------------
-plt.figure()
-plt.hist(y, bins=50)
-plt.title("Price Distribution (Histogram)")
-plt.xlabel("Price")
-plt.ylabel("Count")
-plt.tight_layout()
-plt.savefig(os.path.join(OUT_DIR, "01_price_hist.png"), dpi=200)
-plt.close()
+hist_bar(y.to_numpy())
+ax.set_title("Price Distribution (Histogram)")
+ax.set_xlabel("Price")
+ax.set_ylabel("Count")
+save_plot("01_price_hist.png")
 
 # -----------------------------
 # 2) Log(Price) distribution (more informative if skewed)
 # -----------------------------
-plt.figure()
-plt.hist(np.log1p(y), bins=50)
-plt.title("Log(Price + 1) Distribution")
-plt.xlabel("log(price + 1)")
-plt.ylabel("Count")
-plt.tight_layout()
-plt.savefig(os.path.join(OUT_DIR, "02_log_price_hist.png"), dpi=200)
-plt.close()
+hist_bar(np.log1p(y.to_numpy(dtype=np.float32)))
+ax.set_title("Log(Price + 1) Distribution")
+ax.set_xlabel("log(price + 1)")
+ax.set_ylabel("Count")
+save_plot("02_log_price_hist.png")
 
 # -----------------------------
 # 3) Scatter: Total Area vs Price (strong relationship usually)
 # -----------------------------
 if "total_area" in df_no_id.columns:
-    plt.figure()
-    plt.scatter(df_no_id["total_area"], y, s=5)  # small points
-    plt.title("Total Area vs Price")
-    plt.xlabel("total_area")
-    plt.ylabel("price")
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUT_DIR, "03_total_area_vs_price.png"), dpi=200)
-    plt.close()
+    ax.scatter(df_no_id["total_area"], y, s=5)  # small points
+    ax.set_title("Total Area vs Price")
+    ax.set_xlabel("total_area")
+    ax.set_ylabel("price")
+    save_plot("03_total_area_vs_price.png")
 
 # -----------------------------
 # 4) Boxplot: Price by Top 10 districts (categorical insight)
 # -----------------------------
 if "district_name" in df_no_id.columns:
     top_districts = df_no_id["district_name"].value_counts().head(10).index.tolist()
-    filtered = df_no_id[df_no_id["district_name"].isin(top_districts)].copy()
+    filtered = df_no_id[df_no_id["district_name"].isin(top_districts)]
 
-    data_for_box = [filtered.loc[filtered["district_name"] == d, TARGET].values for d in top_districts]
+    # One hash-group pass instead of a boolean-mask scan per district
+    grouped = filtered.groupby("district_name", sort=False, observed=True)[TARGET]
+    data_for_box = [grouped.get_group(d).values for d in top_districts]
 
-    plt.figure(figsize=(10, 5))
-    plt.boxplot(data_for_box, labels=top_districts, showfliers=False)
-    plt.title("Price by Top 10 Districts (Boxplot)")
-    plt.xlabel("district_name (Top 10)")
-    plt.ylabel("price")
-    plt.xticks(rotation=30, ha="right")
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUT_DIR, "04_price_by_district_boxplot.png"), dpi=200)
-    plt.close()
+    fig.set_size_inches(10, 5)
+    ax.boxplot(data_for_box, labels=top_districts, showfliers=False)
+    ax.set_title("Price by Top 10 Districts (Boxplot)")
+    ax.set_xlabel("district_name (Top 10)")
+    ax.set_ylabel("price")
+    plt.setp(ax.get_xticklabels(), rotation=30, ha="right")
+    save_plot("04_price_by_district_boxplot.png")
+    fig.set_size_inches(*DEFAULT_FIGSIZE)
 
 # -----------------------------
 # 5) Correlation heatmap (numeric features + price)
 #    (using matplotlib only, no seaborn)
 # -----------------------------
-corr_df = df_no_id[num_cols + [TARGET]].corr(numeric_only=True)
-
-plt.figure(figsize=(10, 8))
-plt.imshow(corr_df.values)  # no custom color
-plt.title("Correlation Heatmap (Numeric Features)")
-plt.xticks(range(len(corr_df.columns)), corr_df.columns, rotation=90)
-plt.yticks(range(len(corr_df.index)), corr_df.index)
-plt.colorbar()
-plt.tight_layout()
-plt.savefig(os.path.join(OUT_DIR, "05_corr_heatmap.png"), dpi=200)
-plt.close()
+# float32 + a 20k-row sample: coefficients are stable to ~3 decimals,
+# far finer than the heatmap can show
+corr_sub = df_no_id[num_cols + [TARGET]].astype(np.float32)
+if len(corr_sub) > 20_000:
+    corr_sub = corr_sub.sample(20_000, random_state=0)
+corr_df = corr_sub.corr(numeric_only=True)
+
+fig.set_size_inches(10, 8)
+im = ax.imshow(corr_df.values)  # no custom color
+ax.set_title("Correlation Heatmap (Numeric Features)")
+ax.set_xticks(range(len(corr_df.columns)))
+ax.set_xticklabels(corr_df.columns, rotation=90)
+ax.set_yticks(range(len(corr_df.index)))
+ax.set_yticklabels(corr_df.index)
+fig.colorbar(im, ax=ax)
+save_plot("05_corr_heatmap.png")
+plt.close(fig)
 
 print("✅ Saved graphs into:", OUT_DIR)
 print("Files created:")
@@ -14,7 +14,7 @@ Description:
     and output formatting automatically.
 
 Key Features:
-    - Loads trained model pipeline (preprocessing + Random Forest)
+    - Loads trained model pipeline (preprocessing + Gradient Boosting)
     - Processes test data with same preprocessing as training
     - Generates predictions for all properties in batch
     - Creates properly formatted submission file
@@ -22,11 +22,12 @@ Key Features:
 
 Workflow:
     1. Load trained model from model_pipeline.pkl
-    2. Load test data from CSV
+    2. Stream test data from CSV in ~1 MB record batches
+    For each chunk:
     3. Extract and preserve index column
     4. Generate predictions using loaded pipeline
     5. Create submission DataFrame with index and predictions
-    6. Save results to submission.csv
+    6. Append results to submission.csv
 
 Usage:
     python predict_clean.py
@@ -36,7 +37,7 @@ Prerequisites:
     - data/test.csv must be available
     
 Input:
-    - model_pipeline.pkl (trained model, ~2.9 GB)
+    - model_pipeline.pkl (trained model, a few MB)
     - data/test.csv (test dataset with same 17 features as training)
     
 Output:
@@ -49,7 +50,6 @@ Performance:
     
 Example Output:
     ✓ Model loaded
-    ✓ Test data shape: (50000, 17)
     ✓ Generated 50000 predictions
     ✓ Submission saved to: submission.csv
     
@@ -61,7 +61,9 @@ Example Output:
     ...
 
 Dependencies:
+    - numpy: Index arrays
     - pandas: Data manipulation
+    - pyarrow: Multi-threaded CSV writing
     - joblib: Model loading
 
 Notes:
@@ -69,62 +71,98 @@ Notes:
     - Test data must have same features as training data
     - Missing features will cause errors
     - Index column is preserved for submission tracking
+    - Peak memory is bounded by BLOCK_SIZE, not by the test file size
 
 """
 
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import joblib
 
-# ============================================================================
-# STEP 1: LOAD TRAINED MODEL
-# ============================================================================
-# Load the complete pipeline (preprocessing + model) from disk
-model = joblib.load("model_pipeline.pkl")
-print("✓ Model loaded")
+from data_utils import read_csv_chunks
 
-# ============================================================================
-# STEP 2: LOAD TEST DATA
-# ============================================================================
-# Read test dataset containing properties to predict
-test_df = pd.read_csv("data/test.csv")
-print(f"✓ Test data shape: {test_df.shape}")
+BLOCK_SIZE = 1 << 20  # Bytes of CSV parsed, predicted and written per iteration
 
-# ============================================================================
-# STEP 3: PREPARE DATA FOR PREDICTION
-# ============================================================================
-# Extract and preserve index column for submission file
-# Remove index from features (model wasn't trained on it)
-if "index" in test_df.columns:
-    submission_index = test_df["index"].copy()  # Preserve original index
-    X_test = test_df.drop(columns=["index"])    # Features only
-else:
-    submission_index = pd.Series(range(len(test_df)), name="index")  # Create index
-    X_test = test_df  # Use all columns as features
+# Column types of submission.csv
+SUBMISSION_SCHEMA = pa.schema([("index", pa.int64()), ("price", pa.float64())])
 
-# ============================================================================
-# STEP 4: GENERATE PREDICTIONS
-# ============================================================================
-# Apply trained model to test data
-# Pipeline automatically applies preprocessing before prediction
-predictions = model.predict(X_test)  # Returns array of predicted prices
-print(f"✓ Generated {len(predictions)} predictions")
+SUBMISSION_PATH = "submission.csv"
+SUBMISSION_TMP_PATH = SUBMISSION_PATH + ".tmp"  # Renamed into place once complete
 
 # ============================================================================
-# STEP 5: CREATE SUBMISSION FILE
+# STEP 1: LOAD TRAINED MODEL
 # ============================================================================
-# Format results as DataFrame with index and predicted prices
-submission = pd.DataFrame({
-    "index": submission_index,      # Property IDs
-    "price": predictions            # Predicted prices in RUB
-})
+# Load the complete pipeline (preprocessing + model) from disk
+model = joblib.load("model_pipeline.pkl")
+print("✓ Model loaded")
 
 # ============================================================================
-# STEP 6: SAVE RESULTS
+# STEP 2: STREAM TEST DATA
 # ============================================================================
-# Write predictions to CSV file for submission or further analysis
-submission.to_csv("submission.csv", index=False)
-print("✓ Submission saved to: submission.csv")
+# Read test dataset containing properties to predict in fixed-size chunks
+# (same PyArrow schema and null handling as training) so only one chunk
+# (plus its predictions) is held in memory at a time
+n_predicted = 0
+first_chunk = True
+sample = pd.DataFrame(columns=["index", "price"])
+
+# PyArrow's C++ CSV writer appends one table per chunk. The header is written
+# by hand because Arrow always quotes it ("index","price"), unlike to_csv.
+# Rows go to a temporary file that only replaces submission.csv once every
+# chunk succeeded, so a failed run never leaves a truncated submission.
+with open(SUBMISSION_TMP_PATH, "wb") as sink:
+    sink.write(",".join(SUBMISSION_SCHEMA.names).encode() + b"\n")
+    with pacsv.CSVWriter(
+        sink, SUBMISSION_SCHEMA, write_options=pacsv.WriteOptions(include_header=False)
+    ) as writer:
+        for test_df in read_csv_chunks("data/test.csv", block_size=BLOCK_SIZE):
+            # ========================================================================
+            # STEP 3: PREPARE DATA FOR PREDICTION
+            # ========================================================================
+            # Extract and preserve index column for submission file
+            # Remove index from features (model wasn't trained on it)
+            if "index" in test_df.columns:
+                submission_index = test_df["index"].to_numpy()  # Preserve original index
+                X_test = test_df.drop(columns=["index"])        # Features only
+            else:
+                # Create index (continues numbering across chunks)
+                submission_index = np.arange(n_predicted, n_predicted + len(test_df), dtype=np.int64)
+                X_test = test_df  # Use all columns as features
+
+            # ========================================================================
+            # STEP 4: GENERATE PREDICTIONS
+            # ========================================================================
+            # Apply trained model to test data
+            # Pipeline automatically applies preprocessing before prediction
+            predictions = model.predict(X_test)  # Returns array of predicted prices
+
+            # ========================================================================
+            # STEP 5: CREATE SUBMISSION ROWS
+            # ========================================================================
+            # Format results as DataFrame with index and predicted prices
+            submission = pd.DataFrame({
+                "index": submission_index,  # Property IDs
+                "price": predictions        # Predicted prices in RUB
+            })
+
+            # ========================================================================
+            # STEP 6: SAVE RESULTS
+            # ========================================================================
+            # Append this chunk's rows to submission.csv
+            writer.write_table(pa.Table.from_pandas(submission, schema=SUBMISSION_SCHEMA, preserve_index=False))
+
+            if first_chunk:
+                sample = submission.head(10)  # Kept for verification output
+            first_chunk = False
+            n_predicted += len(submission)
+
+os.replace(SUBMISSION_TMP_PATH, SUBMISSION_PATH)
+print(f"✓ Generated {n_predicted} predictions")
+print(f"✓ Submission saved to: {SUBMISSION_PATH}")
 
 # Display sample predictions for verification
 print("\nSample predictions:")
-print(submission.head(10))
+print(sample)
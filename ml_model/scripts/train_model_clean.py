@@ -2,7 +2,7 @@
 Real Estate Price Prediction - Model Training Script (Clean Version)
 
 This module implements the complete training pipeline for predicting real estate prices
-using Random Forest regression with automated preprocessing for mixed data types.
+using Histogram Gradient Boosting regression with automated preprocessing for mixed data types.
 
 Author: [Your Name]
 Date: January 2026
@@ -15,7 +15,7 @@ Description:
 Key Features:
     - Automated feature type detection (numerical vs categorical)
     - Robust preprocessing pipeline (imputation + encoding)
-    - Random Forest ensemble with 400 trees
+    - Histogram Gradient Boosting with native categorical support
     - 80-20 train-validation split
     - Multiple evaluation metrics (MAE, RMSE, R²)
     - Model persistence for deployment
@@ -26,8 +26,8 @@ Workflow:
     3. Identify numerical and categorical features automatically
     4. Create preprocessing pipelines:
        - Numerical: median imputation
-       - Categorical: most_frequent imputation + one-hot encoding
-    5. Build complete pipeline (preprocessing + Random Forest)
+       - Categorical: most_frequent imputation + ordinal encoding
+    5. Build complete pipeline (preprocessing + Gradient Boosting)
     6. Train on 80% of data, validate on 20%
     7. Evaluate performance with multiple metrics
     8. Save trained model for predictions
@@ -39,16 +39,17 @@ Input:
     - data/data.csv (100,000 property records with 17 features + price)
     
 Output:
-    - model_pipeline.pkl (trained model, ~2.9 GB)
+    - model_pipeline.pkl (trained model, a few MB)
     - Console output with performance metrics
     
 Performance:
-    - Training time: 3-5 minutes on modern hardware
+    - Training time: under a minute on modern hardware
     - Expected R² score: 0.85-0.92
     - Expected MAE: ~650,000 RUB (±10% error)
 
 Dependencies:
     - pandas: Data manipulation
+    - pyarrow: Fast CSV parsing + Parquet cache
     - numpy: Numerical operations
     - scikit-learn: Machine learning algorithms
     - joblib: Model serialization
@@ -74,26 +75,24 @@ Notes:
     - Model must be trained before making predictions
     - Saves complete pipeline (preprocessing + model) for consistency
     - random_state=42 ensures reproducible results
-    - Uses all CPU cores (n_jobs=-1) for faster training
+    - Uses all CPU cores (OpenMP threads) for faster training
 
 """
 
-import pandas as pd
+import os
 import numpy as np
 import joblib
 from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.impute import SimpleImputer
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.ensemble import RandomForestRegressor
+
+from data_utils import build_model, build_preprocessor, load_data
 
 # ============================================================================
 # STEP 1: LOAD DATA
 # ============================================================================
-# Load training dataset from CSV file
-df = pd.read_csv("data/data.csv")
+# Load training dataset (parsed with PyArrow's explicit schema, then cached as Parquet)
+df = load_data("data/data.csv")
 TARGET = "price"  # Target variable: property price in Russian Rubles
 
 # ============================================================================
@@ -107,10 +106,11 @@ y = df[TARGET]  # Target: price (continuous)
 # ============================================================================
 # STEP 3: IDENTIFY FEATURE TYPES
 # ============================================================================
-# Automatically detect categorical (object dtype) and numerical features
+# Automatically detect categorical (object/category dtype) and numerical features
 # This allows the pipeline to handle mixed data types appropriately
-cat_cols = X.select_dtypes(include=["object"]).columns.tolist()  # Categorical: 5 features
-num_cols = [c for c in X.columns if c not in cat_cols]  # Numerical: 12 features
+cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()  # Categorical: 5 features
+cat_set = set(cat_cols)  # O(1) membership checks
+num_cols = [c for c in X.columns if c not in cat_set]  # Numerical: 12 features
 
 print(f"Numerical features ({len(num_cols)}): {num_cols}")
 print(f"Categorical features ({len(cat_cols)}): {cat_cols}")
@@ -118,39 +118,23 @@ print(f"Categorical features ({len(cat_cols)}): {cat_cols}")
 # ============================================================================
 # STEP 4: CREATE PREPROCESSING PIPELINES
 # ============================================================================
-# Build separate preprocessing pipelines for numerical and categorical features
-
-# Numerical Pipeline: Handle missing values with median
-# (Random Forest doesn't require scaling, so we skip StandardScaler)
-numeric_transformer = Pipeline([
-    ("imputer", SimpleImputer(strategy="median"))  # Fill missing with median
-])
-
-# Categorical Pipeline: Handle missing values + convert to binary vectors
-categorical_transformer = Pipeline([
-    ("imputer", SimpleImputer(strategy="most_frequent")),  # Fill missing with mode
-    ("onehot", OneHotEncoder(handle_unknown="ignore"))  # Convert to one-hot encoding
-])
-
-# Combine both pipelines using ColumnTransformer
-# This applies the correct transformation to each feature type
-preprocessor = ColumnTransformer([
-    ("num", numeric_transformer, num_cols),
-    ("cat", categorical_transformer, cat_cols)
-])
+# Shared with validate_cv.py and encode_features.py (defined in data_utils.py):
+# - Numerical: fill missing with median (no scaling for trees)
+# - Categorical: fill missing with mode, then integer codes
+#   (Gradient Boosting splits on the codes natively, so no one-hot expansion)
+preprocessor = build_preprocessor(num_cols, cat_cols)
 
 # ============================================================================
 # STEP 5: BUILD COMPLETE ML PIPELINE
 # ============================================================================
 # Combine preprocessing and model into single pipeline
 # This ensures consistent preprocessing during training and prediction
+# Model hyperparameters are shared with validate_cv.py (build_model in data_utils.py):
+# up to 500 iterations at learning rate 0.05 with early stopping, trees capped
+# at 31 leaves of at least 20 properties, native categorical splits, seed 42
 pipeline = Pipeline([
     ("preprocess", preprocessor),  # Preprocessing step
-    ("model", RandomForestRegressor(  # Random Forest model
-        n_estimators=400,  # 400 decision trees in ensemble
-        random_state=42,   # Seed for reproducibility
-        n_jobs=-1          # Use all CPU cores for parallel training
-    ))
+    ("model", build_model(len(num_cols), len(cat_cols)))  # Gradient Boosting model
 ])
 
 # ============================================================================
@@ -171,9 +155,9 @@ print(f"Validation samples: {len(X_val)}")      # Expected: 20,000
 # STEP 7: TRAIN THE MODEL
 # ============================================================================
 # Fit the complete pipeline on training data
-# This trains preprocessing transformers AND the Random Forest model
+# This trains preprocessing transformers AND the Gradient Boosting model
 print("\nTraining model...")
-pipeline.fit(X_train, y_train)  # Takes 3-5 minutes
+pipeline.fit(X_train, y_train)  # Takes under a minute
 print("Training complete!")
 
 # ============================================================================
@@ -198,7 +182,8 @@ print(f"R²:   {r2:.4f}")           # Target: >0.85 (excellent)
 # ============================================================================
 # Serialize the complete pipeline for later use
 # This saves both preprocessing steps and trained model
-joblib.dump(pipeline, "model_pipeline.pkl")
+# zlib level 3: much smaller file, fast to decompress (joblib.load handles it transparently)
+joblib.dump(pipeline, "model_pipeline.pkl", compress=3)
 print("\n✓ Model saved to: model_pipeline.pkl")
-print("✓ Model size: ~2.9 GB")
+print(f"✓ Model size: {os.path.getsize('model_pipeline.pkl') / (1024**2):.1f} MB")
 print("✓ Ready for predictions!")
@@ -1,81 +1,93 @@
 import os
-import pandas as pd
+import joblib
 import numpy as np
 
-from sklearn.model_selection import KFold, cross_val_score
-from sklearn.compose import ColumnTransformer
+from sklearn.model_selection import KFold, cross_validate
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.impute import SimpleImputer
-from sklearn.ensemble import RandomForestRegressor
+
+from data_utils import PREPROCESSOR_VERSION, build_model, build_preprocessor, load_data
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "data", "data.csv")
 
-print("=" * 70)
-print("✅ CROSS VALIDATION (5-FOLD) - REAL ESTATE PRICE PREDICTION")
-print("=" * 70)
-print("✅ Loading:", DATA_PATH)
-
-df = pd.read_csv(DATA_PATH)
-TARGET = "price"
-
-X = df.drop(columns=[TARGET, "index"])
-y = df[TARGET]
+# Written by encode_features.py (optional)
+ENCODED_PATH = os.path.join(BASE_DIR, "data", "X_encoded.npy")
+TARGET_PATH = os.path.join(BASE_DIR, "data", "y.npy")
+PREPROCESS_PATH = os.path.join(BASE_DIR, "preprocess.pkl")
 
-# Detect column types
-cat_cols = X.select_dtypes(include=["object"]).columns.tolist()
-num_cols = [c for c in X.columns if c not in cat_cols]
 
-numeric_transformer = Pipeline(steps=[
-    ("imputer", SimpleImputer(strategy="median"))
-])
+def load_fitted_preprocessor():
+    """encode_features.py's fitted preprocessor, or None if its output is stale.
 
-categorical_transformer = Pipeline(steps=[
-    ("imputer", SimpleImputer(strategy="most_frequent")),
-    ("onehot", OneHotEncoder(handle_unknown="ignore"))
-])
+    Stale means missing, older than the CSV, or written by a different
+    build_preprocessor() (PREPROCESSOR_VERSION mismatch).
+    """
+    paths = [ENCODED_PATH, TARGET_PATH, PREPROCESS_PATH]
+    if not all(os.path.exists(p) for p in paths):
+        return None
+    if os.path.exists(DATA_PATH) and min(os.path.getmtime(p) for p in paths) < os.path.getmtime(DATA_PATH):
+        return None
+    saved = joblib.load(PREPROCESS_PATH)
+    if not isinstance(saved, dict) or saved.get("version") != PREPROCESSOR_VERSION:
+        return None
+    return saved["preprocess"]
 
-preprocess = ColumnTransformer(
-    transformers=[
-        ("num", numeric_transformer, num_cols),
-        ("cat", categorical_transformer, cat_cols)
-    ]
-)
 
-model = RandomForestRegressor(
-    n_estimators=400,
-    random_state=42,
-    n_jobs=-1
-)
+print("=" * 70)
+print("✅ CROSS VALIDATION (5-FOLD) - REAL ESTATE PRICE PREDICTION")
+print("=" * 70)
 
-pipeline = Pipeline(steps=[
-    ("preprocess", preprocess),
-    ("model", model)
-])
+preprocess = load_fitted_preprocessor()
+if preprocess is not None:
+    # Reuse the matrix encoded by encode_features.py (memory-mapped float64,
+    # the dtype the model works in, so folds are not upcast from float32)
+    # and cross-validate the model alone - no CSV parse, no ColumnTransformer
+    print("✅ Loading encoded features:", ENCODED_PATH)
+    X = np.load(ENCODED_PATH, mmap_mode="r")
+    y = np.load(TARGET_PATH)
+    cols = {name: c for name, _, c in preprocess.transformers_}
+
+    pipeline = build_model(len(cols["num"]), len(cols["cat"]))
+else:
+    print("✅ Loading:", DATA_PATH)
+    df = load_data(DATA_PATH)
+    TARGET = "price"
+
+    X = df.drop(columns=[TARGET, "index"])
+    y = df[TARGET]
+
+    # Detect column types
+    cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
+    cat_set = set(cat_cols)
+    num_cols = [c for c in X.columns if c not in cat_set]
+
+    pipeline = Pipeline(steps=[
+        ("preprocess", build_preprocessor(num_cols, cat_cols)),
+        ("model", build_model(len(num_cols), len(cat_cols)))
+    ])
 
 # 5-Fold CV
 kf = KFold(n_splits=5, shuffle=True, random_state=42)
 
 print("\n⏳ Running 5-Fold Cross Validation...")
 
-mae_scores = -cross_val_score(
+# Fit each fold once and score all three metrics on the same predictions
+# Folds run one after another: each fit already uses every core through
+# the model's OpenMP threads, so parallel folds would only oversubscribe
+scores = cross_validate(
     pipeline, X, y, cv=kf,
-    scoring="neg_mean_absolute_error",
-    n_jobs=-1
+    scoring={
+        "mae": "neg_mean_absolute_error",
+        "mse": "neg_mean_squared_error",
+        "r2": "r2"
+    },
+    n_jobs=1,
+    return_train_score=False
 )
 
-rmse_scores = np.sqrt(-cross_val_score(
-    pipeline, X, y, cv=kf,
-    scoring="neg_mean_squared_error",
-    n_jobs=-1
-))
-
-r2_scores = cross_val_score(
-    pipeline, X, y, cv=kf,
-    scoring="r2",
-    n_jobs=-1
-)
+mae_scores = -scores["test_mae"]
+rmse_scores = np.sqrt(-scores["test_mse"])
+r2_scores = scores["test_r2"]
 
 print("\n✅ CV RESULTS (5 folds)")
 print(f"MAE : mean={mae_scores.mean():.3f}, std={mae_scores.std():.3f}")
@@ -1,8 +1,13 @@
 import os
+import sys
 import joblib
-import pandas as pd
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Shared loaders live next to the training scripts
+sys.path.insert(0, os.path.join(BASE_DIR, "..", "ml_model", "scripts"))
+from data_utils import load_data
+
 MODEL_PATH = os.path.join(BASE_DIR, "model_pipeline.pkl")
 DATA_PATH = os.path.join(BASE_DIR, "data", "data.csv")
 
@@ -11,10 +16,10 @@ print("✅ DEMO: PREDICT ONE PROPERTY")
 print("=" * 70)
 
 model = joblib.load(MODEL_PATH)
-df = pd.read_csv(DATA_PATH)
+df = load_data(DATA_PATH)
 
 # Take one sample row from dataset (drop target)
-sample = df.drop(columns=["price"]).iloc[[0]].copy()
+sample = df.drop(columns=["price"]).iloc[[0]]
 
 # IMPORTANT: remove "index" because training dropped it
 if "index" in sample.columns:
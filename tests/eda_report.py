@@ -1,7 +1,24 @@
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Non-GUI backend: required for plotting from worker threads
 import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from scipy.linalg.blas import get_blas_funcs
+
+plt.rcParams["path.simplify_threshold"] = 1.0  # Drop near-collinear path vertices
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; skewness falls back to NumPy
+    njit = None
 
 # ----------------------------
 # CONFIG: adjust these if needed
@@ -15,16 +32,98 @@ DATA_PATHS_TO_TRY = [
 
 TARGET_COL = "price"
 CATEGORICAL_COLS = ["gas", "hot_water", "central_heating", "extra_area_type_name", "district_name"]
+AREA_COLS = ["total_area", "kitchen_area", "bath_area"]
+
+# Categoricals are parsed as Arrow dictionaries, i.e. pandas "category" (integer codes)
+CATEGORICAL_DTYPES = {c: pa.dictionary(pa.int32(), pa.string()) for c in CATEGORICAL_COLS}
+
+# Columns never read from the CSV (row IDs add nothing to the EDA and make
+# every row unique, which would hide real duplicates)
+IGNORE_COLS = ["index"]
 
 OUTPUT_DIR = "outputs_eda"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Parquet copy of each parsed CSV, one file per source path (reused while it
+# is newer than the CSV and its stored fingerprint still matches)
+CACHE_TEMPLATE = os.path.join(OUTPUT_DIR, "_cache_{}.parquet")
+CACHE_META_KEY = b"eda_report_source"
+CACHE_VERSION = 2  # Bump when read_csv_fast() changes column types
+
+# EDA thumbnails: 120 dpi has ~1/3 the pixels of 200 dpi to rasterize and encode
+SAVEFIG_KW = dict(dpi=120, bbox_inches="tight")
+
+# pyplot's current-figure state is global, so figures are built one at a time
+PLOT_LOCK = threading.Lock()
+
+
+def read_csv_fast(p):
+    # Peek at the header so only wanted columns are parsed, with known types
+    header = pd.read_csv(p, nrows=0).columns
+    wanted = [c for c in header if c not in IGNORE_COLS]
+    float_cols = [c for c in [TARGET_COL] + AREA_COLS if c in wanted]
+    cat_cols = [c for c in CATEGORICAL_COLS if c in wanted]
+
+    # PyArrow's multi-threaded C++ parser; pandas only sees the finished columns
+    column_types = {
+        **{c: pa.float64() for c in float_cols},  # Reported values keep full precision
+        **{c: CATEGORICAL_DTYPES[c] for c in cat_cols},
+    }
+    return pacsv.read_csv(
+        p,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=wanted,
+            column_types=column_types,
+            null_values=["", "NA"],
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def cache_fingerprint(p):
+    # Everything that decides what read_csv_fast() parses from this file
+    return json.dumps({
+        "source": os.path.abspath(p),
+        "size": os.path.getsize(p),
+        "ignore_cols": IGNORE_COLS,
+        "version": CACHE_VERSION,
+    }).encode()
+
+
+def cached_fingerprint(cache_path):
+    metadata = pq.read_schema(cache_path).metadata or {}
+    return metadata.get(CACHE_META_KEY)
+
 
 def load_data():
     for p in DATA_PATHS_TO_TRY:
         if os.path.exists(p):
+            cache_path = CACHE_TEMPLATE.format(os.path.splitext(p)[0].replace("/", "_"))
+            fingerprint = cache_fingerprint(p)
+            if (
+                os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(p)
+                and cached_fingerprint(cache_path) == fingerprint
+            ):
+                print(f"✅ Loaded dataset: {p} (cached: {cache_path})")
+                return pd.read_parquet(cache_path, engine="pyarrow")
+            # Cache the parsed Arrow table as-is, before pandas conversion
+            tbl = read_csv_fast(p)
+            tbl = tbl.replace_schema_metadata({**(tbl.schema.metadata or {}), CACHE_META_KEY: fingerprint})
+            # Write then rename, so an interrupted run never leaves a truncated
+            # cache; an unwritable cache only costs the next run a re-parse
+            tmp_path = cache_path + ".tmp"
+            try:
+                pq.write_table(tbl, tmp_path, compression="snappy")
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
             print(f"✅ Loaded dataset: {p}")
-            return pd.read_csv(p)
+            # split_blocks + self_destruct: each Arrow column is freed as it is
+            # converted and never consolidated into a 2D block, so peak memory
+            # stays close to one copy of the data
+            return tbl.to_pandas(split_blocks=True, self_destruct=True)
     raise FileNotFoundError(
         "Could not find dataset. Put train.csv inside a data/ folder or update DATA_PATHS_TO_TRY."
     )
@@ -36,12 +135,51 @@ def save_table(df: pd.DataFrame, filename: str):
     print(f"✅ Saved: {out_path}")
 
 
-def main():
-    df = load_data()
+def _save(name, fig=None):
+    # bbox_inches="tight" (in SAVEFIG_KW) trims the outer margins in a single
+    # bbox pass; multi-panel figures are created with layout="constrained"
+    fig = fig or plt.gcf()
+    fig.savefig(os.path.join(OUTPUT_DIR, name), **SAVEFIG_KW)
+    plt.close(fig)
+
 
-    # ----------------------------
-    # 1) Basic dataset info
-    # ----------------------------
+def sym_gram(A: np.ndarray) -> np.ndarray:
+    # A.T @ A via syrk, which fills only the upper triangle (half the FLOPs of
+    # a full matmul); mirror it afterwards. A.T is Fortran-ordered, so no copy.
+    syrk = get_blas_funcs("syrk", (A,))  # ssyrk for float32, dsyrk for float64
+    upper = syrk(1.0, A.T, trans=0, lower=0)
+    return upper + upper.T - np.diag(np.diag(upper))
+
+
+def fast_corr(numeric_df: pd.DataFrame) -> pd.DataFrame:
+    # Pairwise-complete Pearson correlation (same as DataFrame.corr): each pair
+    # of columns uses only the rows where both are present. With M the
+    # presence mask and Xz the values zeroed where missing, every pairwise sum
+    # is one matrix product. Columns are centred first so the float32 sums
+    # don't cancel.
+    X = numeric_df.to_numpy(dtype=np.float32, copy=False)
+    mask = ~np.isnan(X)
+    M = mask.astype(np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = (np.where(mask, X, np.float32(0.0)).sum(axis=0) / mask.sum(axis=0)).astype(X.dtype)
+    Xz = np.where(mask, X - mu, np.float32(0.0))
+
+    n = sym_gram(M)            # n[i, j]: rows where both i and j are present
+    sx = Xz.T @ M              # sx[i, j]: sum of column i over those rows
+    sxx = (Xz * Xz).T @ M      # sxx[i, j]: sum of squares of column i over those rows
+    sxy = sym_gram(Xz)         # sxy[i, j]: cross products over those rows
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n  # var[i, j]: variance of column i over the pair's rows
+        corr = np.clip(cov / np.sqrt(var * var.T), -1.0, 1.0)
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+
+# ----------------------------
+# 1) Basic dataset info
+# ----------------------------
+def do_summary(df):
     info = pd.DataFrame({
         "rows": [df.shape[0]],
         "columns": [df.shape[1]],
@@ -49,123 +187,241 @@ def main():
     })
     save_table(info, "dataset_summary.csv")
 
-    # ----------------------------
-    # 2) Missing values table
-    # ----------------------------
-    missing = df.isna().sum().sort_values(ascending=False)
-    missing_pct = (missing / len(df) * 100).round(3)
+
+# ----------------------------
+# 2) Missing values table
+# ----------------------------
+def do_missing(df):
+    counts = df.isna().sum(axis=0).to_numpy()
+    pct = np.round(counts * (100.0 / len(df)), 3)
+    order = np.argsort(-counts, kind="stable")  # Most missing first
     missing_table = pd.DataFrame({
-        "feature": missing.index,
-        "missing_count": missing.values,
-        "missing_percent": missing_pct.values
+        "feature": df.columns.to_numpy()[order],
+        "missing_count": counts[order],
+        "missing_percent": pct[order]
     })
     save_table(missing_table, "missing_values.csv")
 
-    # ----------------------------
-    # 3) Duplicate check
-    # ----------------------------
-    dup_count = df.duplicated().sum()
+
+# ----------------------------
+# 3) Duplicate check
+# ----------------------------
+def do_duplicates(df):
+    # One uint64 hash per row; duplicates = rows minus distinct hashes
+    h = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    dup_count = h.size - np.unique(h).size
     dup_table = pd.DataFrame({"duplicate_rows": [int(dup_count)]})
     save_table(dup_table, "duplicates.csv")
 
-    # ----------------------------
-    # 4) Price distribution
-    # ----------------------------
-    if TARGET_COL in df.columns:
-        price = df[TARGET_COL].dropna()
 
-        # Histogram: raw price
+# ----------------------------
+# 4) Price distribution
+# ----------------------------
+def do_price(price_vals):
+    # Own float32 copy: binned here, then log-transformed in place below
+    price_arr = price_vals.astype(np.float32)
+
+    # Histogram: raw price (binned by NumPy, drawn as precomputed bars)
+    counts, edges = np.histogram(price_arr, bins=50)
+    with PLOT_LOCK:
         plt.figure()
-        plt.hist(price, bins=50)
+        plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
         plt.title("Price distribution (raw)")
         plt.xlabel("price")
         plt.ylabel("count")
-        plt.tight_layout()
-        plt.savefig(os.path.join(OUTPUT_DIR, "price_hist_raw.png"), dpi=200)
-        plt.close()
+        _save("price_hist_raw.png")
 
-        # Skewness
-        skew_raw = float(price.skew())
-        skew_table = pd.DataFrame({"price_skewness_raw": [skew_raw]})
-        save_table(skew_table, "price_skewness.csv")
+    # Skewness
+    skew_raw = fast_skew(price_vals)
+    skew_table = pd.DataFrame({"price_skewness_raw": [skew_raw]})
+    save_table(skew_table, "price_skewness.csv")
 
-        # Histogram: log1p(price)
-        price_log = np.log1p(price)
+    # Histogram: log1p(price), computed in place (no second array)
+    price_log = np.log1p(price_arr, out=price_arr)
+    counts, edges = np.histogram(price_log, bins=50)
+    with PLOT_LOCK:
         plt.figure()
-        plt.hist(price_log, bins=50)
+        plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
         plt.title("Price distribution (log1p)")
         plt.xlabel("log1p(price)")
         plt.ylabel("count")
-        plt.tight_layout()
-        plt.savefig(os.path.join(OUTPUT_DIR, "price_hist_log1p.png"), dpi=200)
-        plt.close()
+        _save("price_hist_log1p.png")
 
-    # ----------------------------
-    # 5) Correlation heatmap (numerical only)
-    # ----------------------------
-    numeric_df = df.select_dtypes(include=[np.number]).copy()
-    if TARGET_COL in numeric_df.columns:
-        corr = numeric_df.corr(numeric_only=True)
 
+# ----------------------------
+# 5) Correlation heatmap (numerical only)
+# ----------------------------
+def do_corr(df):
+    # float32 halves the bytes moved through the correlation matmul
+    numeric_df = df.select_dtypes(include=[np.number])
+    numeric_df = numeric_df.astype(
+        {c: np.float32 for c in numeric_df.select_dtypes(include=[np.float64]).columns}
+    )
+    if TARGET_COL not in numeric_df.columns:
+        return
+    corr = fast_corr(numeric_df)
+
+    with PLOT_LOCK:
+        # Symmetric matrix: show the upper triangle (incl. diagonal) only
+        upper_only = np.where(np.triu(np.ones(corr.shape, dtype=bool)), corr.to_numpy(), np.nan)
         plt.figure(figsize=(10, 8))
-        plt.imshow(corr.values, aspect="auto")
+        plt.imshow(upper_only, aspect="auto")
         plt.colorbar()
         plt.xticks(range(len(corr.columns)), corr.columns, rotation=90)
         plt.yticks(range(len(corr.columns)), corr.columns)
         plt.title("Correlation heatmap (numerical features)")
-        plt.tight_layout()
-        plt.savefig(os.path.join(OUTPUT_DIR, "correlation_heatmap.png"), dpi=200)
-        plt.close()
-
-        corr_out = corr.reset_index().rename(columns={"index": "feature"})
-        save_table(corr_out, "correlation_matrix.csv")
-
-    # ----------------------------
-    # 6) Categorical value counts (top districts + yes/no)
-    # ----------------------------
-    for col in CATEGORICAL_COLS:
-        if col in df.columns:
-            vc = df[col].astype("string").fillna("Missing").value_counts().reset_index()
-            vc.columns = [col, "count"]
-            save_table(vc, f"value_counts_{col}.csv")
-
-            # Plot only if not too many categories
-            top = vc.head(10)
-            plt.figure(figsize=(9, 4))
-            plt.bar(top[col].astype(str), top["count"])
-            plt.title(f"Top 10 categories: {col}")
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            plt.savefig(os.path.join(OUTPUT_DIR, f"top10_{col}.png"), dpi=200)
-            plt.close()
-
-    # ----------------------------
-    # 7) Outlier discussion helpers (percentiles + scatter)
-    # ----------------------------
-    # You can change these if your dataset uses different names
-    for area_col in ["total_area", "kitchen_area", "bath_area"]:
-        if area_col in df.columns and TARGET_COL in df.columns:
-            area = df[area_col].dropna()
-            price = df[TARGET_COL].dropna()
-
-            # Percentiles
-            p = area.quantile([0.01, 0.05, 0.95, 0.99]).to_frame(name="value").reset_index()
-            p.columns = ["percentile", "value"]
-            save_table(p, f"percentiles_{area_col}.csv")
-
-            # Scatter (sample if huge)
-            tmp = df[[area_col, TARGET_COL]].dropna()
-            if len(tmp) > 5000:
-                tmp = tmp.sample(5000, random_state=42)
-
-            plt.figure()
-            plt.scatter(tmp[area_col], tmp[TARGET_COL], s=8)
-            plt.title(f"{area_col} vs price (sampled)")
-            plt.xlabel(area_col)
-            plt.ylabel("price")
-            plt.tight_layout()
-            plt.savefig(os.path.join(OUTPUT_DIR, f"scatter_{area_col}_vs_price.png"), dpi=200)
-            plt.close()
+        _save("correlation_heatmap.png")
+
+    # Dense float matrix: write it straight from the ndarray with np.savetxt
+    cols = list(corr.columns)
+    out_path = os.path.join(OUTPUT_DIR, "correlation_matrix.csv")
+    rows = np.column_stack([np.array(cols, dtype=object), corr.to_numpy()])
+    with open(out_path, "w", encoding="utf-8") as fh:
+        fh.write("feature," + ",".join(cols) + "\n")
+        np.savetxt(fh, rows, fmt=["%s"] + ["%.6f"] * len(cols), delimiter=",")
+    print(f"✅ Saved: {out_path}")
+
+
+# ----------------------------
+# 6) Categorical value counts (top districts + yes/no)
+# ----------------------------
+def do_cats(df, col):
+    # Count integer category codes (-1 = missing) instead of hashing strings;
+    # columns are already "category" from read time, so this is a no-op cast
+    s = df[col].astype("category")
+    codes = s.cat.codes.to_numpy()
+    counts = np.bincount(codes + 1, minlength=len(s.cat.categories) + 1)
+    names = np.concatenate([["Missing"], s.cat.categories.astype(str).to_numpy()])
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    vc = pd.DataFrame({col: names[order], "count": counts[order]})
+    save_table(vc, f"value_counts_{col}.csv")
+
+    # Plot only the top 10 (drawn later with the other columns in one figure)
+    return vc.head(10)
+
+
+def plot_top_categories(tops):
+    # One figure with a panel per categorical column instead of a figure each;
+    # constrained layout keeps each panel's rotated labels clear of the next title
+    fig, axes = plt.subplots(
+        len(tops), 1, figsize=(9, 4 * len(tops)), squeeze=False, layout="constrained"
+    )
+    for ax, (col, top) in zip(axes[:, 0], tops.items()):
+        ax.bar(top[col].astype(str), top["count"])
+        ax.set_title(f"Top 10 categories: {col}")
+        ax.tick_params(axis="x", labelrotation=45)
+        plt.setp(ax.get_xticklabels(), ha="right")
+    _save("top10_categories.png", fig)
+
+
+# ----------------------------
+# 7) Outlier discussion helpers (percentiles + scatter)
+# ----------------------------
+def do_area(df, area_col, price_mask):
+    # Percentiles (one NumPy partition pass on the non-null values)
+    area_arr = df[area_col].to_numpy(dtype=np.float64, copy=False)
+    area_arr = area_arr[~np.isnan(area_arr)]
+    levels = [0.01, 0.05, 0.95, 0.99]
+    # An all-missing column reports NaN percentiles (as Series.quantile did)
+    values = np.quantile(area_arr, levels) if area_arr.size else np.full(len(levels), np.nan)
+    p = pd.DataFrame({"percentile": levels, "value": values})
+    save_table(p, f"percentiles_{area_col}.csv")
+
+    # Density plot over all non-null rows: a 2D histogram renders in
+    # O(grid) time regardless of row count, so no sampling is needed
+    mask = df[area_col].notna().to_numpy() & price_mask
+    a = df[area_col].to_numpy()[mask]
+    pr = df[TARGET_COL].to_numpy()[mask]
+    H, xe, ye = np.histogram2d(a, pr, bins=80)
+
+    with PLOT_LOCK:
+        plt.figure()
+        plt.imshow(np.log1p(H.T), origin="lower", extent=[xe[0], xe[-1], ye[0], ye[-1]], aspect="auto")
+        plt.colorbar(label="log1p(count)")
+        plt.title(f"{area_col} vs price (density)")
+        plt.xlabel(area_col)
+        plt.ylabel("price")
+        _save(f"scatter_{area_col}_vs_price.png")
+
+
+def _skew_moments(x):
+    # Single pass: running mean, 2nd and 3rd central moment sums (Welford/Terriberry)
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    for i in range(x.size):
+        n1 = n
+        n += 1
+        delta = x[i] - mean
+        delta_n = delta / n
+        term1 = delta * delta_n * n1
+        mean += delta_n
+        m3 += term1 * delta_n * (n - 2) - 3.0 * delta_n * m2
+        m2 += term1
+    return m2, m3
+
+
+if njit is not None:
+    _skew_moments = njit(cache=True, fastmath=True)(_skew_moments)
+
+
+def fast_skew(x: np.ndarray) -> float:
+    # Bias-corrected sample skewness, same definition as pandas Series.skew()
+    x = np.asarray(x, dtype=np.float64)
+    n = x.size
+    if n < 3:
+        return float("nan")
+    if njit is not None:
+        m2, m3 = _skew_moments(x)
+    else:
+        d = x - x.mean()
+        m2 = float(np.dot(d, d))
+        m3 = float(np.dot(d * d, d))
+    if m2 == 0:
+        return 0.0
+    g1 = np.sqrt(n) * m3 / m2 ** 1.5
+    return float(g1 * np.sqrt(n * (n - 1)) / (n - 2))
+
+
+def main():
+    df = load_data()
+
+    # Sections only read df, so they run concurrently; the heavy lifting is
+    # in NumPy/pandas/BLAS, which release the GIL
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(do_summary, df),
+            pool.submit(do_missing, df),
+            pool.submit(do_duplicates, df),
+            pool.submit(do_corr, df),
+        ]
+
+        if TARGET_COL in df.columns:
+            # Non-null target mask + values, computed once and reused by sections 4 and 7
+            price_mask = df[TARGET_COL].notna().to_numpy()
+            price_vals = df[TARGET_COL].to_numpy()[price_mask]
+            futures.append(pool.submit(do_price, price_vals))
+
+            # You can change AREA_COLS if your dataset uses different names
+            for area_col in AREA_COLS:
+                if area_col in df.columns:
+                    futures.append(pool.submit(do_area, df, area_col, price_mask))
+
+        cat_futures = {
+            col: pool.submit(do_cats, df, col)
+            for col in CATEGORICAL_COLS
+            if col in df.columns
+        }
+
+        # Re-raise any exception from a worker
+        for fut in futures:
+            fut.result()
+        tops = {col: fut.result() for col, fut in cat_futures.items()}
+
+    if tops:
+        plot_top_categories(tops)
 
     print(f"\n🎉 DONE. All EDA outputs saved in: {OUTPUT_DIR}/")
 